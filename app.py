@@ -1,250 +1,112 @@
 import streamlit as st
-import re
-import spacy
-import pdfplumber  # Library for reading PDF files
-from docx import Document  # Library for reading DOCX files
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from resume_parser import (
+    FIELD_SKILLS, FIELD_SKILLS_LOWER, READERS, calculate_match_percentages, extract_person_name, process_one, skills_to_mask
+)
 
 #############################################
-# 1. Define Skills Database and Field Mapping
-#############################################
-
-# List of skills (technical & non-technical) to look for in resumes
-SKILLS_DB = [
-    # Technical Skills
-    "python", "java", "c++", "sql", "machine learning", "data analysis",
-    "tensorflow", "pytorch", "scikit-learn", "nlp", "deep learning",
-    "html", "css", "javascript", "react", "angular", "node.js", "django", "flask",
-    "aws", "azure", "gcp", "docker", "kubernetes", "cybersecurity", "data visualization",
-    "software development", "api development", "cloud computing", "blockchain", "microservices",
-    "big data", "hadoop", "spark", "tableau", "power bi", "data mining", "ai ethics",
-    "robotics", "embedded systems", "computer vision", "image processing",
-    "ethical hacking", "penetration testing", "iot", "devops", "graphql", "rest api",
-    "web development", "mobile development", "android", "ios", "swift", "kotlin",
-    "game development", "unity", "unreal engine", "c#", "3d modeling", "animation",
-    "quantum computing", "network security", "cryptography", "bioinformatics",
-    "matlab", "r programming", "sas", "statistical analysis", "genetic algorithms",
-    "autocad", "solidworks", "finite element analysis", "control systems",
-
-    # Non-Technical / Soft Skills
-    "communication", "project management", "leadership", "teamwork", "problem solving",
-    "time management", "critical thinking", "creativity", "adaptability", "conflict resolution",
-    "customer service", "sales", "marketing", "strategic planning", "negotiation",
-    "budget management", "public speaking", "event planning", "human resources", "finance",
-    "accounting", "research", "writing", "organization", "interpersonal skills",
-    "presentation skills", "active listening", "decision making", "emotional intelligence",
-    "mentoring", "coaching", "networking", "cross-functional collaboration",
-    "stakeholder management", "change management", "stress management", "cultural awareness",
-    "diversity and inclusion", "team building", "self-motivation", "resilience",
-    "work ethic", "multitasking", "conflict mediation", "persuasion",
-    "analytical thinking", "design thinking", "customer relationship management (crm)"
-]
-
-
-# Mapping between job fields and required skills
-FIELD_SKILLS = {
-    "Computer Science": [
-        "python", "java", "c++", "sql", "machine learning", "data analysis",
-        "tensorflow", "pytorch", "scikit-learn", "nlp", "deep learning",
-        "software development", "api development", "cloud computing",
-        "cybersecurity", "blockchain", "devops", "big data", "artificial intelligence"
-    ],
-    "Teaching": [
-        "communication", "leadership", "teamwork", "time management",
-        "critical thinking", "creativity", "curriculum development", "public speaking",
-        "educational technology", "student assessment"
-    ],
-    "Marketing": [
-        "communication", "strategic planning", "negotiation", "sales",
-        "marketing", "digital marketing", "seo", "content creation", "social media",
-        "branding", "advertising", "market research", "email marketing"
-    ],
-    "Finance": [
-        "accounting", "budget management", "financial analysis", "data analysis",
-        "excel", "risk management", "finance", "investment management", "cryptocurrency",
-        "financial modeling"
-    ],
-    "Healthcare": [
-        "patient care", "medical terminology", "communication", "empathy",
-        "teamwork", "data analysis", "organization", "health informatics",
-        "clinical research", "telemedicine"
-    ],
-    "Engineering": [
-        "mechanical engineering", "electrical engineering", "civil engineering",
-        "structural analysis", "matlab", "cad", "robotics", "control systems"
-    ],
-    "Human Resources": [
-        "recruitment", "employee relations", "performance management",
-        "hr policies", "conflict resolution", "talent acquisition"
-    ],
-    "Law": [
-        "legal research", "contract law", "intellectual property law",
-        "corporate law", "litigation", "compliance"
-    ],
-    "E-commerce": [
-        "shopify", "woocommerce", "customer experience", "e-commerce marketing",
-        "conversion rate optimization", "inventory management"
-    ],
-    "Graphic Design": [
-        "photoshop", "illustrator", "figma", "ui/ux design", "typography",
-        "branding", "motion graphics"
-    ],
-    "Project Management": [
-        "agile", "scrum", "kanban", "risk management", "budgeting",
-        "stakeholder communication"
-    ],
-    "Data Science": [
-        "data visualization", "data engineering", "sql", "python",
-        "r programming", "machine learning", "deep learning"
-    ],
-    "Game Development": [
-        "unity", "unreal engine", "c#", "game physics", "3d modeling",
-        "game design", "shader programming"
-    ],
-    "Cybersecurity": [
-        "penetration testing", "network security", "encryption", "ethical hacking",
-        "incident response", "firewall management"
-    ],
-    "Robotics": [
-        "robot kinematics", "ros", "automation", "control systems",
-        "embedded systems", "sensor fusion"
-    ],
-    "Biotechnology": [
-        "genetic engineering", "bioprocessing", "molecular biology",
-        "bioinformatics", "clinical research"
-    ],
-    "Environmental Science": [
-        "climate change", "sustainability", "waste management", "ecology",
-        "environmental impact assessment"
-    ],
-    "Sports Science": [
-        "exercise physiology", "sports nutrition", "biomechanics",
-        "athletic training", "injury prevention"
-    ],
-    "Hospitality Management": [
-        "hotel management", "event planning", "customer service",
-        "food and beverage management", "tourism"
-    ],
-    "Aerospace Engineering": [
-        "aerodynamics", "propulsion systems", "avionics",
-        "aircraft design", "flight simulation"
-    ],
-    "Fashion Design": [
-        "textile design", "pattern making", "fashion illustration",
-        "trend analysis", "garment construction"
-    ]
-}
-
-#############################################
-# 2. Load and Cache spaCy Model
+# 1. Load and Cache spaCy Model
 #############################################
 
 @st.cache_resource
 def load_nlp_model():
     """
     Load the spaCy language model and cache it for session reuse.
+    Only NER (and the tok2vec layer it listens to) is used, so every other
+    component is excluded and its weights are never read from disk.
+    Called lazily from the NER name fallback, so spaCy is only imported and
+    loaded once a resume actually needs it.
     """
+    import spacy
+
     try:
-        return spacy.load("en_core_web_sm")
+        return spacy.load("en_core_web_sm", exclude=["tagger", "parser", "senter", "attribute_ruler", "lemmatizer"])
     except Exception as e:
         st.error("SpaCy model 'en_core_web_sm' not found. Install via: python -m spacy download en_core_web_sm")
         return None
 
-nlp = load_nlp_model()
-if not nlp:
-    st.stop()
-
 #############################################
-# 3. File Reading Functions
+# 2. Resume Processing
 #############################################
 
-def read_pdf(file):
-    """Extract text from a PDF file using pdfplumber."""
-    text = ""
-    try:
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-    except Exception as e:
-        st.error(f"Error reading PDF: {e}")
-    return text
-
-def read_docx(file):
-    """Extract text from a DOCX file using python-docx."""
-    text = ""
-    try:
-        doc = Document(file)
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-    except Exception as e:
-        st.error(f"Error reading DOCX: {e}")
-    return text
+# os.cpu_count() may return None, in which case a single worker is used
+MAX_WORKERS = os.cpu_count() or 1
 
-def read_txt(file):
-    """Extract text from a TXT file."""
-    text = ""
-    try:
-        text = file.read().decode("utf-8", errors="ignore")
-    except Exception as e:
-        st.error(f"Error reading TXT file: {e}")
-    return text
-
-#############################################
-# 4. Extraction Functions
-#############################################
-def extract_name(text):
+@st.cache_resource
+def get_process_pool():
     """
-    Extract the candidate's name from the resume text.
-    Steps:
-    1. Use spaCy NER to find PERSON entities and filter out those with digits.
-    2. Return the first valid PERSON entity based on text position.
-    3. If no valid entity is found, use a regex fallback for two or more capitalized words.
-    
-    Returns:
-        Candidate name (str) or "Not found" if no name is detected.
+    Create the worker pool once per server process.
+    Workers are started on demand, up to one per CPU. "spawn" is used because
+    forking Streamlit's multithreaded server process is not safe.
     """
-    doc_spacy = nlp(text)
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    return ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
 
-    name_pattern = r"^(Dr\.|Mr\.|Ms\.|Mrs\.)?\s*[A-Za-z\s,]+(,\s*(MD|PhD|Jr\.|Sr\.))?$"
-    excluded_headers = {"work experience", "education history", "relevant skills", 
-                       "volunteer work", "geriatric medicine", "contact information"}
-    for i, line in enumerate(lines[:5]):
-        if (re.match(name_pattern, line) and 
-            line.lower() not in excluded_headers):
-            return line
-        else:
-            return "Not found"
-        
-def extract_emails(text):
-    """Extract all email addresses from text using regex."""
-    email_pattern = r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
-    return re.findall(email_pattern, text)
-
-def extract_phone_numbers(text):
-    """Extract phone numbers from text using regex."""
-    phone_pattern = r"(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}"
-    return re.findall(phone_pattern, text)
+@st.cache_resource
+def get_process_pool_lock():
+    """Create the lock that serializes replacing a broken worker pool across upload threads."""
+    return threading.Lock()
 
-def extract_skills(text):
-    """Extract skills from text by matching with predefined skill list."""
-    text_lower = text.lower()
-    found_skills = [skill for skill in SKILLS_DB if skill.lower() in text_lower]
-    return list(set(found_skills))  # Remove duplicates
+def replace_broken_pool(pool):
+    """
+    Drop the cached worker pool if it is still the given broken one.
+    Another upload thread may have replaced it already; clearing again would
+    evict (and leak) that fresh pool.
+    """
+    with get_process_pool_lock():
+        if get_process_pool() is pool:
+            get_process_pool.clear()
+            pool.shutdown(wait=False)
 
-def calculate_match_percentage(extracted_skills, required_skills):
-    """Calculate skill match percentage between extracted and required skills."""
-    if not required_skills:
-        return 0, []
-    extracted_set = set(map(str.lower, extracted_skills))
-    required_set = set(map(str.lower, required_skills))
-    matching = extracted_set.intersection(required_set)
-    percentage = (len(matching) / len(required_set)) * 100
-    return round(percentage, 2), list(matching)
+@st.cache_data(show_spinner=False)
+def parse_resume(file_bytes, extension):
+    """
+    Parse a resume in the worker pool.
+    Cached on the file contents, so reruns triggered by sidebar widgets
+    return the previous result instead of re-reading the file.
+    A worker that dies (e.g. out of memory on a huge PDF) breaks the whole pool;
+    the pool is replaced and BrokenProcessPool re-raised, so the failure is never cached.
+    """
+    pool = get_process_pool()
+    try:
+        return pool.submit(process_one, file_bytes, extension).result()
+    except BrokenProcessPool:
+        replace_broken_pool(pool)
+        raise
+
+def parse_upload(file_bytes, extension):
+    """Parse a resume, retrying once on a fresh pool if a worker crash broke the current one."""
+    for _ in range(2):
+        try:
+            return parse_resume(file_bytes, extension)
+        except BrokenProcessPool:
+            pass
+    return {
+        "name": "Not found",
+        "name_search_text": None,
+        "emails": [],
+        "phones": [],
+        "skills": frozenset(),
+        "skills_mask": 0,
+        "error": f"Error reading {extension.upper()} file: the worker process crashed",
+    }
+
+@st.cache_data(show_spinner=False)
+def find_names_with_ner(texts):
+    """
+    Run spaCy NER over all texts in one nlp.pipe batch and return the first PERSON name per text.
+    Cached on the texts, so sidebar reruns don't run the model again.
+    """
+    nlp = load_nlp_model()
+    if nlp is None:
+        return [None] * len(texts)
+    return [extract_person_name(doc_spacy) for doc_spacy in nlp.pipe(texts, batch_size=16)]
 
 #############################################
-# 5. Streamlit User Interface
+# 3. Streamlit User Interface
 #############################################
 
 st.title("Resume Parser")
@@ -253,24 +115,41 @@ st.title("Resume Parser")
 st.sidebar.header("Job Role Matching")
 selected_field = st.sidebar.selectbox("Select Field of Work", list(FIELD_SKILLS.keys()))
 selected_skills = st.sidebar.multiselect("Select Required Skills", options=FIELD_SKILLS[selected_field])
+required_mask = skills_to_mask(FIELD_SKILLS_LOWER[selected_field].intersection(selected_skills))
 
 # File uploader: Accepts multiple resume files
-uploaded_files = st.file_uploader("Upload resumes (PDF, DOCX, TXT)", type=["pdf", "docx", "txt"], accept_multiple_files=True)
+uploaded_files = st.file_uploader("Upload resumes (PDF, DOCX, TXT)", type=list(READERS), accept_multiple_files=True)
 
 if uploaded_files:
-    for uploaded_file in uploaded_files:
+    file_bytes = [uploaded_file.getvalue() for uploaded_file in uploaded_files]
+    extensions = [uploaded_file.name.split('.')[-1].lower() for uploaded_file in uploaded_files]
+
+    # Parse all files concurrently; each thread only waits on its worker process
+    # (cached per file, so only new uploads are parsed). More threads than pool
+    # workers would just queue, so the thread count is capped at the pool size.
+    with ThreadPoolExecutor(max_workers=min(len(uploaded_files), MAX_WORKERS)) as executor:
+        resumes = list(executor.map(parse_upload, file_bytes, extensions))
+
+    # Resumes whose header gave no name fall back to NER, batched across files
+    unnamed = [resume for resume in resumes if resume["name_search_text"]]
+    if unnamed:
+        ner_names = find_names_with_ner([resume["name_search_text"] for resume in unnamed])
+        for resume, ner_name in zip(unnamed, ner_names):
+            resume["name"] = ner_name or "Not found"
+
+    # Match every resume against the selected skills in one vectorized step
+    match_percentages = calculate_match_percentages([resume["skills_mask"] for resume in resumes], required_mask)
+
+    for uploaded_file, resume, match_percentage in zip(uploaded_files, resumes, match_percentages):
         st.header(f"Processing file: {uploaded_file.name}")
-        extension = uploaded_file.name.split('.')[-1].lower()
-
-        # Read the file based on its format
-        resume_text = read_pdf(uploaded_file) if extension == "pdf" else read_docx(uploaded_file) if extension == "docx" else read_txt(uploaded_file)
+        if resume["error"]:
+            st.error(resume["error"])
 
         # Extract details
-        name = extract_name(resume_text)
-        emails = extract_emails(resume_text)
-        phones = extract_phone_numbers(resume_text)
-        skills_extracted = extract_skills(resume_text)
-        match_percentage, matched_skills = calculate_match_percentage(skills_extracted, selected_skills)
+        name = resume["name"]
+        emails = resume["emails"]
+        phones = resume["phones"]
+        skills_extracted = resume["skills"]
 
         # Display extracted details
         st.subheader("Extracted Information")
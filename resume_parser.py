@@ -0,0 +1,359 @@
+"""
+Resume parsing logic: skill tables, file readers and extractors.
+
+Kept free of Streamlit so app.py can run it in worker processes.
+"""
+import io
+import re
+from itertools import islice
+import re2  # Linear-time RE2 engine for email/phone scanning
+import ahocorasick  # Multi-pattern string matching for skill extraction
+import numpy as np
+import pymupdf  # Library for reading PDF files (MuPDF bindings)
+from docx import Document  # Library for reading DOCX files
+
+#############################################
+# 1. Define Skills Database and Field Mapping
+#############################################
+
+# List of skills (technical & non-technical) to look for in resumes
+SKILLS_DB = [
+    # Technical Skills
+    "python", "java", "c++", "sql", "machine learning", "data analysis",
+    "tensorflow", "pytorch", "scikit-learn", "nlp", "deep learning",
+    "html", "css", "javascript", "react", "angular", "node.js", "django", "flask",
+    "aws", "azure", "gcp", "docker", "kubernetes", "cybersecurity", "data visualization",
+    "software development", "api development", "cloud computing", "blockchain", "microservices",
+    "big data", "hadoop", "spark", "tableau", "power bi", "data mining", "ai ethics",
+    "robotics", "embedded systems", "computer vision", "image processing",
+    "ethical hacking", "penetration testing", "iot", "devops", "graphql", "rest api",
+    "web development", "mobile development", "android", "ios", "swift", "kotlin",
+    "game development", "unity", "unreal engine", "c#", "3d modeling", "animation",
+    "quantum computing", "network security", "cryptography", "bioinformatics",
+    "matlab", "r programming", "sas", "statistical analysis", "genetic algorithms",
+    "autocad", "solidworks", "finite element analysis", "control systems",
+
+    # Non-Technical / Soft Skills
+    "communication", "project management", "leadership", "teamwork", "problem solving",
+    "time management", "critical thinking", "creativity", "adaptability", "conflict resolution",
+    "customer service", "sales", "marketing", "strategic planning", "negotiation",
+    "budget management", "public speaking", "event planning", "human resources", "finance",
+    "accounting", "research", "writing", "organization", "interpersonal skills",
+    "presentation skills", "active listening", "decision making", "emotional intelligence",
+    "mentoring", "coaching", "networking", "cross-functional collaboration",
+    "stakeholder management", "change management", "stress management", "cultural awareness",
+    "diversity and inclusion", "team building", "self-motivation", "resilience",
+    "work ethic", "multitasking", "conflict mediation", "persuasion",
+    "analytical thinking", "design thinking", "customer relationship management (crm)"
+]
+
+
+# Mapping between job fields and required skills
+FIELD_SKILLS = {
+    "Computer Science": [
+        "python", "java", "c++", "sql", "machine learning", "data analysis",
+        "tensorflow", "pytorch", "scikit-learn", "nlp", "deep learning",
+        "software development", "api development", "cloud computing",
+        "cybersecurity", "blockchain", "devops", "big data", "artificial intelligence"
+    ],
+    "Teaching": [
+        "communication", "leadership", "teamwork", "time management",
+        "critical thinking", "creativity", "curriculum development", "public speaking",
+        "educational technology", "student assessment"
+    ],
+    "Marketing": [
+        "communication", "strategic planning", "negotiation", "sales",
+        "marketing", "digital marketing", "seo", "content creation", "social media",
+        "branding", "advertising", "market research", "email marketing"
+    ],
+    "Finance": [
+        "accounting", "budget management", "financial analysis", "data analysis",
+        "excel", "risk management", "finance", "investment management", "cryptocurrency",
+        "financial modeling"
+    ],
+    "Healthcare": [
+        "patient care", "medical terminology", "communication", "empathy",
+        "teamwork", "data analysis", "organization", "health informatics",
+        "clinical research", "telemedicine"
+    ],
+    "Engineering": [
+        "mechanical engineering", "electrical engineering", "civil engineering",
+        "structural analysis", "matlab", "cad", "robotics", "control systems"
+    ],
+    "Human Resources": [
+        "recruitment", "employee relations", "performance management",
+        "hr policies", "conflict resolution", "talent acquisition"
+    ],
+    "Law": [
+        "legal research", "contract law", "intellectual property law",
+        "corporate law", "litigation", "compliance"
+    ],
+    "E-commerce": [
+        "shopify", "woocommerce", "customer experience", "e-commerce marketing",
+        "conversion rate optimization", "inventory management"
+    ],
+    "Graphic Design": [
+        "photoshop", "illustrator", "figma", "ui/ux design", "typography",
+        "branding", "motion graphics"
+    ],
+    "Project Management": [
+        "agile", "scrum", "kanban", "risk management", "budgeting",
+        "stakeholder communication"
+    ],
+    "Data Science": [
+        "data visualization", "data engineering", "sql", "python",
+        "r programming", "machine learning", "deep learning"
+    ],
+    "Game Development": [
+        "unity", "unreal engine", "c#", "game physics", "3d modeling",
+        "game design", "shader programming"
+    ],
+    "Cybersecurity": [
+        "penetration testing", "network security", "encryption", "ethical hacking",
+        "incident response", "firewall management"
+    ],
+    "Robotics": [
+        "robot kinematics", "ros", "automation", "control systems",
+        "embedded systems", "sensor fusion"
+    ],
+    "Biotechnology": [
+        "genetic engineering", "bioprocessing", "molecular biology",
+        "bioinformatics", "clinical research"
+    ],
+    "Environmental Science": [
+        "climate change", "sustainability", "waste management", "ecology",
+        "environmental impact assessment"
+    ],
+    "Sports Science": [
+        "exercise physiology", "sports nutrition", "biomechanics",
+        "athletic training", "injury prevention"
+    ],
+    "Hospitality Management": [
+        "hotel management", "event planning", "customer service",
+        "food and beverage management", "tourism"
+    ],
+    "Aerospace Engineering": [
+        "aerodynamics", "propulsion systems", "avionics",
+        "aircraft design", "flight simulation"
+    ],
+    "Fashion Design": [
+        "textile design", "pattern making", "fashion illustration",
+        "trend analysis", "garment construction"
+    ]
+}
+
+# Lowercased views of the skill tables, computed once at import instead of per resume
+SKILLS_LOWER = tuple(skill.lower() for skill in SKILLS_DB)
+FIELD_SKILLS_LOWER = {
+    field: frozenset(skill.lower() for skill in skills)
+    for field, skills in FIELD_SKILLS.items()
+}
+
+# Bit position for every known skill (SKILLS_DB plus field-only skills), so a set of
+# skills can be stored as one int and unpacked into a 0/1 row for batch matching
+SKILL_NAMES = tuple(dict.fromkeys(
+    [*SKILLS_LOWER, *(skill.lower() for skills in FIELD_SKILLS.values() for skill in skills)]
+))
+SKILL_IDX = {skill: i for i, skill in enumerate(SKILL_NAMES)}
+SKILL_MASK_BYTES = (len(SKILL_NAMES) + 7) // 8
+
+# Aho-Corasick automaton over SKILLS_DB, built once so every resume is matched in a single pass
+SKILLS_AUTOMATON = ahocorasick.Automaton()
+for skill in SKILLS_LOWER:
+    SKILLS_AUTOMATON.add_word(skill, skill)
+SKILLS_AUTOMATON.make_automaton()
+
+#############################################
+# 2. File Reading Functions
+#############################################
+
+def read_pdf(file):
+    """Extract text from a PDF file using PyMuPDF."""
+    with pymupdf.open(stream=file.read(), filetype="pdf") as pdf:
+        return "\n".join(page.get_text("text") for page in pdf)
+
+def read_docx(file):
+    """Extract text from a DOCX file using python-docx."""
+    doc = Document(file)
+    return "".join(para.text + "\n" for para in doc.paragraphs)
+
+def read_txt(file):
+    """Extract text from a TXT file."""
+    return file.read().decode("utf-8", errors="ignore")
+
+# Reader for each supported file extension
+READERS = {"pdf": read_pdf, "docx": read_docx, "txt": read_txt}
+
+#############################################
+# 3. Extraction Functions
+#############################################
+
+# Regex patterns compiled once at import instead of on every call.
+# Email/phone scans run over the whole resume, so they use RE2 (linear time, no backtracking).
+NAME_RE = re.compile(r"^(Dr\.|Mr\.|Ms\.|Mrs\.)?\s*[A-Za-z\s,]+(,\s*(MD|PhD|Jr\.|Sr\.))?$")
+# A whole line of two or more capitalized words, which may be hyphenated or joined by an apostrophe ("Mary-Jane Watson")
+NAME_FALLBACK_RE = re.compile(r"[A-Z][a-z]+(?:[-'][A-Z][a-z]+)*(?:\s+[A-Z][a-z]+(?:[-'][A-Z][a-z]+)*)+")
+DIGIT_RE = re.compile(r"\d")
+# The (possibly empty) run of digits at a position; matched on the resume bytes
+DIGIT_RUN_RE = re.compile(rb"\d*")
+# A non-empty line, minus its leading whitespace; used to walk the resume header lazily
+LINE_RE = re.compile(r"\S[^\n]*")
+# Whitespace that re's Unicode \s matches but RE2's bytes \s does not (NBSP, thin space, \v, ...)
+EXTRA_SPACE_RE = re.compile(r"[^\S\t\n\f\r ]")
+# Emails and phone numbers share one pattern so the resume is scanned only once for both.
+# The pattern is ASCII-only and runs on the UTF-8 bytes of the resume, which spares RE2
+# from encoding the text and mapping match offsets back to str indices on every call.
+# RE2 has no lookarounds, so phone digit boundaries are checked on each match instead.
+CONTACT_RE = re2.compile(
+    rb"(?P<email>[A-Za-z0-9_.+-]+@[A-Za-z0-9-]+\.[A-Za-z0-9.\-]+)"
+    rb"|(?P<phone>(?:\+\d{1,3}[-.\s]?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4})"
+)
+
+def extract_name(text):
+    """
+    Extract the candidate's name from the resume text.
+    Steps:
+    1. Look at the first five non-empty lines, where resumes put the candidate's name.
+    2. Return the first line that looks like a name and is not a section header.
+    3. If no line qualifies, use a regex fallback for a line of two or more capitalized words.
+       The whole line must match, so titles beside a name ("Senior Data Scientist | Acme Corp")
+       are left to NER rather than returned.
+    Resumes that still return "Not found" go to the spaCy NER fallback in app.py.
+    
+    Returns:
+        Candidate name (str) or "Not found" if no name is detected.
+    """
+    excluded_headers = {"work experience", "education history", "relevant skills", 
+                       "volunteer work", "geriatric medicine", "contact information"}
+    # Stop after the header instead of splitting the whole resume into lines
+    lines = [match.group().rstrip() for match in islice(LINE_RE.finditer(text), 5)]
+    for line in lines:
+        if (NAME_RE.match(line) and 
+            line.lower() not in excluded_headers):
+            return line
+    for line in lines:
+        if NAME_FALLBACK_RE.fullmatch(line) and line.lower() not in excluded_headers:
+            return line
+    return "Not found"
+
+def extract_header(text, max_lines=10, max_chars=1000):
+    """Return the first non-empty lines of the resume, where the candidate's name is expected."""
+    lines = (match.group().rstrip() for match in islice(LINE_RE.finditer(text), max_lines))
+    return "\n".join(lines)[:max_chars]
+
+def extract_person_name(doc_spacy):
+    """
+    Return the first PERSON entity without digits from a parsed spaCy Doc, or None.
+    Entities come out in document order, so the first valid one is the earliest in the text.
+    """
+    for ent in doc_spacy.ents:
+        if ent.label_ == "PERSON" and not DIGIT_RE.search(ent.text):
+            return ent.text.strip()
+    return None
+        
+def is_digit_bounded(text, start, end):
+    """Check that text[start:end] (str or bytes) is not part of a longer run of digits."""
+    return not text[start - 1:start].isdigit() and not text[end:end + 1].isdigit()
+
+def extract_contacts(text_bytes):
+    """Extract email addresses and phone numbers from UTF-8 encoded text in a single regex pass."""
+    emails, phones = [], []
+    pos = 0
+    while match := CONTACT_RE.search(text_bytes, pos):
+        email, phone = match.groups()
+        if email:
+            emails.append(email.decode())
+        elif is_digit_bounded(text_bytes, match.start(), match.end()):
+            phones.append(phone.decode())
+        else:
+            # A phone may still start inside the rejected span ("560 001 9876543210"), but not
+            # in the middle of a digit run, so resume after the run the rejected match starts in
+            pos = max(DIGIT_RUN_RE.match(text_bytes, match.start()).end(), match.start() + 1)
+            continue
+        pos = match.end()
+    return emails, phones
+
+def is_word_bounded(text, start, end):
+    """Check that text[start:end] is not part of a longer word (e.g. "java" in "javascript")."""
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not before.isalnum() and not after.isalnum()
+
+def skills_to_mask(skills):
+    """Encode lowercase skill names as a bitmask over SKILL_IDX."""
+    mask = 0
+    for skill in skills:
+        mask |= 1 << SKILL_IDX[skill]
+    return mask
+
+def masks_to_matrix(masks):
+    """Unpack skill bitmasks into a (len(masks), len(SKILL_NAMES)) matrix of 0/1 values."""
+    packed = np.frombuffer(b"".join(mask.to_bytes(SKILL_MASK_BYTES, "little") for mask in masks), dtype=np.uint8)
+    return np.unpackbits(packed.reshape(len(masks), SKILL_MASK_BYTES), axis=1, count=len(SKILL_NAMES), bitorder="little")
+
+def extract_skills(text_lower):
+    """
+    Extract skills from already-lowercased text by matching with predefined skill list.
+    Returns the skills as a frozenset and the same skills encoded as a bitmask.
+    """
+    found_skills = frozenset(
+        skill for end, skill in SKILLS_AUTOMATON.iter(text_lower)
+        if is_word_bounded(text_lower, end - len(skill) + 1, end + 1)
+    )
+    return found_skills, skills_to_mask(found_skills)
+
+def calculate_match_percentages(extracted_masks, required_mask):
+    """
+    Calculate the skill match percentage of every resume against the required skills at once.
+    The resumes become one 0/1 matrix, so all match counts are a single matrix-vector product.
+    """
+    if not required_mask:
+        return np.zeros(len(extracted_masks))
+    resume_matrix = masks_to_matrix(extracted_masks)
+    required_vector = masks_to_matrix([required_mask])[0].astype(np.int32)
+    matches = resume_matrix @ required_vector
+    return np.round(matches * 100 / required_vector.sum(), 2)
+
+#############################################
+# 4. Resume Processing
+#############################################
+
+def process_one(file_bytes, extension):
+    """
+    Read a resume and run all extractors on it.
+    This runs in a worker process, so a read failure is returned under
+    "error" for the UI to display instead of being shown with st.error.
+    """
+    resume_text = ""
+    error = None
+
+    # Read the file based on its format
+    reader = READERS.get(extension)
+    if reader is None:
+        error = f"Unsupported file type: .{extension}"
+    else:
+        try:
+            resume_text = reader(io.BytesIO(file_bytes))
+        except Exception as e:
+            error = f"Error reading {extension.upper()} file: {e}"
+
+    # Lowercase once and share it with every case-insensitive extractor
+    resume_text_lower = resume_text.lower()
+    # Regex scans run on bytes; the skill automaton needs str (pyahocorasick is built for unicode).
+    # Other whitespace becomes a plain space first so phone separators like NBSP still match.
+    resume_bytes = EXTRA_SPACE_RE.sub(" ", resume_text).encode("utf-8")
+
+    name = extract_name(resume_text)
+    emails, phones = extract_contacts(resume_bytes)
+    skills, skills_mask = extract_skills(resume_text_lower)
+    return {
+        "name": name,
+        # Header text for the spaCy NER fallback in app.py, only needed when the regexes found no name.
+        # Running NER on the header alone keeps it to a few dozen tokens instead of the whole resume.
+        "name_search_text": extract_header(resume_text) if name == "Not found" else None,
+        "emails": emails,
+        "phones": phones,
+        "skills": skills,
+        "skills_mask": skills_mask,
+        "error": error,
+    }
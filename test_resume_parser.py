@@ -0,0 +1,103 @@
+import io
+import random
+import re
+
+from docx import Document
+
+import resume_parser
+from resume_parser import (
+    calculate_match_percentages, extract_contacts, extract_name, extract_skills, process_one, skills_to_mask
+)
+
+# The phone pattern as written with lookarounds, which RE2 cannot run
+PHONE_REF_RE = re.compile(r"(?<!\d)(?:\+\d{1,3}[-.\s]?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)")
+
+def phones(text):
+    return extract_contacts(text.encode("utf-8"))[1]
+
+def test_phone_after_rejected_digit_run():
+    assert phones("Bangalore 560 001 9876543210") == ["9876543210"]
+
+def test_phone_inside_longer_digit_run_is_rejected():
+    assert phones("ID 123456789012345") == []
+
+def test_phones_match_lookaround_pattern():
+    rnd = random.Random(0)
+    alphabet = "0123456789" * 4 + " -.()+a\n"
+    for _ in range(20000):
+        text = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(5, 40)))
+        assert phones(text) == PHONE_REF_RE.findall(text), text
+
+def test_rejected_phones_cost_one_search_per_digit_run(monkeypatch):
+    calls = []
+    contact_re = resume_parser.CONTACT_RE
+
+    class CountingContactRe:
+        def search(self, text, pos):
+            calls.append(pos)
+            return contact_re.search(text, pos)
+
+    monkeypatch.setattr(resume_parser, "CONTACT_RE", CountingContactRe())
+    runs = 1000
+    assert phones("12345678901234 " * runs) == []
+    assert len(calls) <= runs + 1
+
+def test_phone_with_unicode_space_separators():
+    result = process_one("Tel:\xa0555\xa0123\xa04567".encode("utf-8"), "txt")
+    assert result["phones"] == ["555 123 4567"]
+
+def test_docx_line_breaks_and_tabs_separate_text():
+    doc = Document()
+    para = doc.add_paragraph("Jane Doe")
+    para.add_run().add_break()
+    para.add_run("jane@example.com")
+    doc.add_paragraph("Phone:\t555-123-4567")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    result = process_one(buffer.getvalue(), "docx")
+    assert result["name"] == "Jane Doe"
+    assert result["emails"] == ["jane@example.com"]
+    assert result["phones"] == ["555-123-4567"]
+
+def test_hyphenated_name_is_kept_whole():
+    assert extract_name("Mary-Jane Watson\nmj@example.com") == "Mary-Jane Watson"
+
+def test_job_title_beside_separator_is_not_a_name():
+    assert extract_name("Senior Data Scientist | Acme Corp\n123 Main Street") == "Not found"
+
+def test_skills_inside_longer_words_are_not_matched():
+    assert extract_skills("javascript, bios and wholesales")[0] == {"javascript"}
+
+def test_skills_with_punctuation_at_word_edges():
+    skills, mask = extract_skills("java, (c++), c#; node.js.")
+    assert skills == {"java", "c++", "c#", "node.js"}
+    assert mask == skills_to_mask(skills)
+
+def test_match_percentages_for_several_resumes():
+    required_mask = skills_to_mask({"python", "java", "sql"})
+    resume_masks = [
+        extract_skills("python, java and sql")[1],
+        extract_skills("python and java")[1],
+        extract_skills("no listed skills")[1],
+    ]
+    assert calculate_match_percentages(resume_masks, required_mask).tolist() == [100.0, 66.67, 0.0]
+
+def test_field_only_skill_counts_towards_required_skills():
+    # "artificial intelligence" is a Computer Science skill but not in SKILLS_DB, so no resume can match it
+    required_mask = skills_to_mask({"python", "artificial intelligence"})
+    resume_masks = [extract_skills("python, artificial intelligence")[1]]
+    assert calculate_match_percentages(resume_masks, required_mask).tolist() == [50.0]
+
+def test_no_required_skills_gives_zero_matches():
+    resume_masks = [extract_skills("python")[1], 0]
+    assert calculate_match_percentages(resume_masks, 0).tolist() == [0.0, 0.0]
+
+def test_unsupported_file_type_is_reported():
+    result = process_one(b"MZ\x90\x00", "exe")
+    assert result["error"] == "Unsupported file type: .exe"
+    assert result["name"] == "Not found"
+
+def test_corrupt_pdf_is_reported():
+    result = process_one(b"%PDF-1.7 not really a pdf", "pdf")
+    assert result["error"].startswith("Error reading PDF file: ")
+    assert result["skills"] == frozenset()